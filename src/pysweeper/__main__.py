@@ -19,10 +19,24 @@ where:
 import os
 import sys
 import argparse
-import time
 
 from . import board
 
+PROMPT = "Next move? "
+
+def one_line(text: str, width: int) -> str:
+    """Cut text down so it fits on one line of the terminal without wrapping
+
+    Args:
+        text (str): text to print
+        width (int): width of the terminal
+
+    Returns:
+        str: text, truncated to at most width - 1 characters
+    """
+    return text[:width - 1]
+
+
 def main(argv):
     """Parse command-line arguments
 
@@ -57,32 +71,43 @@ def main(argv):
 
     try:
         game = board.GameBoard(args.rows,args.cols,args.mines)
+        notice = None
         while not game.complete():
+            # The board may be redrawn in place, so everything printed below it must stay on one line each
             print(game)
-            print("'(o)pen r c' -> Opens the cell at row r column c")
-            print("'(f)lag r c' -> Flags the cell at row r column c")
-            move = input("Next move? ").strip()
-
-            if len(move) != 5:
-                print("Incomplete or invalid command. Please use o (open) and f (flag) to play")
-                time.sleep(2.0)
+            print(one_line("'(o)pen r c' -> Opens the cell at row r column c", game.term_width))
+            print(one_line("'(f)lag r c' -> Flags the cell at row r column c", game.term_width))
+            if notice:
+                # Problems with the last move are shown here, under the redrawn board
+                print(one_line(notice, game.term_width), file=sys.stderr)
+                notice = None
+            move = input(PROMPT)
+            if len(PROMPT + move) >= game.term_width:
+                # A move that wrapped may have scrolled the board
+                game.redraw()
+            move = move.split()
+
+            if len(move) != 3:
+                notice = "Incomplete or invalid command. Please use o (open) and f (flag) to play"
                 continue
 
-            cmd = move[0].lower()
-            row = move[2].upper()
-            col = move[4].upper()
+            cmd = move[0][0].lower()
+            row = move[1].upper()
+            col = move[2].upper()
 
             if cmd not in ("o", "f"):
-                print("Invalid command '" + cmd + "'. Please use open (or o) and flag (or f) to play")
-                time.sleep(2.0)
+                notice = "Invalid command '" + cmd + "'. Please use open (or o) and flag (or f) to play"
                 continue
 
             if not game.is_cell(row, col):
-                print("Invalid coordinates: " + row + " " + col)
-                time.sleep(2.0)
+                notice = "Invalid coordinates: " + row + " " + col
                 continue
 
             if cmd == "o":
+                if game.is_flagged(row, col):
+                    notice = "Use f " + row + " " + col + " to remove the flag on this cell before opening."
+                    continue
+
                 if not game.open(row, col):
                     game.reveal()
                     print(game)
@@ -11,20 +11,34 @@ Returns:
 """
 import os
 import random
-import time
+from collections import deque
+
+import colorama
 
 from . import cell
 
+# Let Windows consoles understand the ANSI sequences used to redraw the board
+colorama.just_fix_windows_console()
+
 COORD_LIST = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+COORD_IDX = {c: i for i, c in enumerate(COORD_LIST)}
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Terminal line (1-based) where the first row of the board is drawn by render_full()
+BOARD_TOP = 4
+# Widest a cell can be drawn: emoji are 2 columns, and keycaps and the flag are padded with a space
+# for terminals that draw them 1 column wide
+CELL_WIDTH = 3
+# Lines needed below the board rows for the footer, a blank line, the move instructions, a notice,
+# the prompt and the line the cursor moves to when the move is entered
+BOARD_BOTTOM = 7
 
 class GameBoard:
     """Game board class.
     """
-    _board_cells = []
-    _mine_cells = []
-    _board = {}
-    _max_r = None
-    _max_c = None
+    __slots__ = ('_board_cells', '_mine_cells', '_board', '_neighbors', '_max_r', '_max_c',
+                 '_r_size', '_c_size', '_mines_left', '_flagged_count', '_open_count', '_header', '_footer',
+                 '_term_height', '_term_width', '_frame_width', '_dirty', '_drawn', '_row_chars', '_col_chars')
 
     def __init__(self, r_size: int, c_size: int, num_mines=-1):
         """Create the game board
@@ -34,42 +48,155 @@ class GameBoard:
             c_size (int): Vertical size
             num_mines (int, optional): Number of mines. Defaults to -1 (random).
         """
+        self._board_cells = range(0)
+        self._mine_cells = set()
+        self._board = []
+        self._neighbors = []
+        self._max_r = None
+        self._max_c = None
+        self._header = ""
+        self._footer = ""
+        self._row_chars = ()
+        self._col_chars = ()
+        self._term_height = None
+        self._term_width = None
+        self._frame_width = None
+        self._dirty = set()
+        self._drawn = False
         self._get_term_size()
         self.r_size = r_size
         self.c_size = c_size
         self.mines_left = num_mines
+        self._flagged_count = 0
+        self._open_count = 0
         self._create_board()
+        self._create_frame()
 
 
     def __repr__(self):
         """Representation matters
 
+        Note:
+            Once the board has been drawn, only the rows that changed since the last render are redrawn.
+            The full board is redrawn if the terminal was resized, if the board and the prompt below it are
+            too tall for the terminal, or if any line of the board is too wide for it. Scrolling or wrapping
+            would move the rows away from where render_incremental() expects them.
+
         Returns:
             str: String representation of the board
         """
-        if os.name == "posix":
-            _ = os.system('clear')
-        elif os.name == "nt":
-            _ = os.system('cls')
-        else:
-            pass
+        _width, _height = os.get_terminal_size()
+        if (_width, _height) != (self._term_width, self._term_height):
+            self._term_width = _width
+            self._term_height = _height
+            self._drawn = False
+
+        if (self._drawn and
+            BOARD_TOP + self.r_size + BOARD_BOTTOM - 1 <= self._term_height and
+            self._frame_width < self._term_width):
+            return self.render_incremental()
+
+        return self.render_full()
+
+
+    def render_full(self) -> str:
+        """Clear the screen and draw the whole board
+
+        Returns:
+            str: String representation of the board
+        """
+        self._dirty.clear()
+        self._drawn = True
+        _display = [CLEAR_SCREEN, self._header.format(mines_left=self.mines_left - self._num_flagged())]
+        for _row in range(self.r_size):
+            _display.append(self._render_row(_row))
+            _display.append("\n")
+        _display.append(self._footer)
+        return "".join(_display)
+
+
+    def _render_row(self, row: int) -> str:
+        """(private) Draw one row of the board, including its label and borders
+
+        Args:
+            row (int): row index
+
+        Returns:
+            str: String representation of the row
+        """
+        _row_start = row * self.c_size
+        return (self._row_chars[row] + "|" +
+                "".join(str(c) for c in self._board[_row_start:_row_start + self.c_size]) + "|")
+
+
+    def redraw(self):
+        """Make the next render clear the screen and draw the whole board
 
-        _display = " "
+        Note:
+            Used when something printed below the board (e.g. a long move) may have scrolled the screen.
+        """
+        self._drawn = False
+
+
+    @property
+    def term_width(self) -> int:
+        """(property) Width of the terminal at the last render
+
+        Returns:
+            int: number of columns
+        """
+        return self._term_width
+
+
+    def render_incremental(self) -> str:
+        """Redraw only the rows that changed since the last render, plus the mines left counter
+
+        Note:
+            Relies on the screen still showing the output of render_full(). Whole rows are redrawn, exactly
+            as render_full() draws them, because how wide a terminal draws each cell's emoji varies. The
+            cursor is left (and the screen cleared) just below the board, where render_full() would have left it.
+
+        Returns:
+            str: ANSI escape sequences that update the board in place
+        """
+        _display = []
+        for _row in self._dirty:
+            _display.append("\x1b[" + str(BOARD_TOP + _row) + ";1H")
+            _display.append(self._render_row(_row) + "\x1b[K")
+        self._dirty.clear()
+
+        # The top border is plain ASCII, so the counter always starts right after it
+        _display.append("\x1b[" + str(BOARD_TOP - 1) + ";" + str(4 + (self.c_size * 2)) + "H")
+        _display.append("   Mines Left: " + str(self.mines_left - self._num_flagged()) + "\x1b[K")
+        _display.append("\x1b[" + str(BOARD_TOP + self.r_size + 1) + ";1H\x1b[J")
+        return "".join(_display)
+
+
+    def _create_frame(self):
+        """(private) Build the parts of the display that don't change during a game
+
+        Note:
+            The header has a {mines_left} placeholder that __repr__ fills in. _frame_width is the widest line
+            the board can draw: either the top border with the counter at its longest (no flags, or every cell
+            flagged), or a row of CELL_WIDTH wide cells.
+        """
+        self._row_chars = tuple(COORD_LIST[:self.r_size])
+        self._col_chars = tuple(COORD_LIST[:self.c_size])
+        _header = [" "]
         if self.r_size > 9:
-            _display += " " * int(((self.c_size * 2) - 9) / 2)
-        _display += "PySweeper\n"
-        _display += "  "
-        _display += "".join([ " " + c for c in COORD_LIST[:self.c_size] ])
-        _display += "\n"
-        _display += " /" + "-" * ((self.c_size * 2)) + "\\"
-        _display += "   Mines Left: " + str(self.mines_left - self._num_flagged()) + "\n"
-        for r in COORD_LIST[:self.r_size]:
-            _display += r + "|"
-            for c in COORD_LIST[:self.c_size]:
-                _display += str(self._board[(r,c)])
-            _display += "|\n"
-        _display += " \\" + "-" * ((self.c_size * 2))  + "/\n"
-        return _display
+            _header.append(" " * int(((self.c_size * 2) - 9) / 2))
+        _header.append("PySweeper\n")
+        _header.append("  ")
+        _header.append("".join([ " " + c for c in self._col_chars ]))
+        _header.append("\n")
+        _header.append(" /" + "-" * ((self.c_size * 2)) + "\\")
+        _header.append("   Mines Left: {mines_left}\n")
+        self._header = "".join(_header)
+        self._footer = " \\" + "-" * ((self.c_size * 2))  + "/\n"
+
+        _counter_width = max(len(str(self.mines_left)), len(str(self.mines_left - len(self._board_cells))))
+        self._frame_width = max([len(_line) for _line in self._header.format(mines_left="0" * _counter_width).split("\n")] +
+                                [3 + (self.c_size * CELL_WIDTH)])
 
 
     def _get_term_size(self):
@@ -78,15 +205,18 @@ class GameBoard:
         Raises:
             ValueError: if the screen is too narrow or too short
         """
-        if os.get_terminal_size()[0] > 46:
+        _width, _height = os.get_terminal_size()
+        self._term_height = _height
+        self._term_width = _width
+        if _width > 46:
             self._max_r = 36
         else:
-            self._max_r = os.get_terminal_size()[0] - 10
+            self._max_r = _width - 10
 
-        if os.get_terminal_size()[1] > 41:
+        if _height > 41:
             self._max_c = 36
         else:
-            self._max_c = os.get_terminal_size()[1] - 7
+            self._max_c = _height - 7
 
         if self._max_r < 0:
             raise ValueError("Screen is too narrow. Minimum screen width is 10 columns.")
@@ -184,87 +314,146 @@ class GameBoard:
 
     def _create_board(self):
         """Creates the board
+
+        Note:
+            Cells are stored in a flat list indexed by (row * c_size) + col. See _idx().
         """
-        self._board_cells = [ (r,c) for r in COORD_LIST[:self.r_size] for c in COORD_LIST[:self.c_size] ]
-        self._mine_cells = random.sample(self._board_cells, self.mines_left)
-        for _cell in self._board_cells:
-            if _cell in self._mine_cells:
-                self._board[_cell] = cell.GameCell(name="M",mine=True)
-            else:
-                _neighbor_mines = list(filter(lambda cell: cell in self._mine_cells, self._get_neighbors(_cell)))
-                self._board[_cell] = cell.GameCell(name=str(len(_neighbor_mines)),mine=False)
+        self._board_cells = range(self.r_size * self.c_size)
+        self._mine_cells = set(random.sample(self._board_cells, self.mines_left))
+        self._create_neighbors()
 
+        # Each mine bumps the count of its neighbors, rather than every cell counting the mines around it
+        _neighbor_mines = [0] * len(self._board_cells)
+        for _mine in self._mine_cells:
+            for _neighbor in self._neighbors_of(_mine):
+                _neighbor_mines[_neighbor] += 1
 
-    def _get_neighbors(self,_cell,flagged=False,unmarked=False) -> list:
-        """Get the neighboring cells in the board
+        self._board = [ cell.GameCell(name="M",mine=True) if _cell in self._mine_cells
+                        else cell.GameCell(name=str(_neighbor_mines[_cell]),mine=False)
+                        for _cell in self._board_cells ]
+
+
+    def _create_neighbors(self):
+        """(private) Build the neighbor lookup for every cell in the board
            based on https://stackoverflow.com/questions/1620940/determining-neighbours-of-cell-two-dimensional-list
 
+        Note:
+            Neighbors never change during a game so they are computed once here instead of on every lookup.
+        """
+        self._neighbors = []
+        for _cell in self._board_cells:
+            _cell_r, _cell_c = divmod(_cell, self.c_size)
+            self._neighbors.append(tuple(r2 * self.c_size + c2
+                                         for r2 in range(max(0, _cell_r-1), min(self.r_size, _cell_r+2))
+                                             for c2 in range(max(0, _cell_c-1), min(self.c_size, _cell_c+2))
+                                                 if (_cell_r != r2 or _cell_c != c2)))
+
+
+    def _idx(self, row: str, col: str) -> int:
+        """(private) Convert user-facing coordinates into a cell index
+
         Args:
-            _cell    (tuple) : cell coordinates (row, col)
-            flagged  (bool)  : Only return neighboring cells that have been flagged as potential mines
-            unmarked (bool)  : Only return neighboring cells that have NOT been opened nor flagged
+            row (str): row coordinate
+            col (str): column coordinate
 
         Returns:
-            list: list of neighboring cells
+            int: index of the cell in the board
         """
-        _cell_r = COORD_LIST.index(_cell[0])
-        _cell_c = COORD_LIST.index(_cell[1])
-        _neighbors = [(COORD_LIST[r2],COORD_LIST[c2])
-                         for r2 in range(_cell_r-1,_cell_r+2)
-                             for c2 in range(_cell_c-1,_cell_c+2)
-                                 if ((_cell_r != r2 or _cell_c != c2) and
-                                     (0 <= r2 <= self.r_size - 1) and
-                                     (0 <= c2 <= self.c_size - 1)
-                                     )]
+        return COORD_IDX[row] * self.c_size + COORD_IDX[col]
 
-        if unmarked:
-            return list(filter(lambda cell: not self._board[cell].is_flagged() and not self._board[cell].is_open(), _neighbors))
 
-        if flagged:
-            return list(filter(lambda cell: self._board[cell].is_flagged(), _neighbors))
+    def _neighbors_of(self,_cell) -> tuple:
+        """Get the (cached) neighboring cells in the board
 
+        Args:
+            _cell (int) : cell index
 
-        return _neighbors
+        Returns:
+            tuple: neighboring cell indexes
+        """
+        return self._neighbors[_cell]
 
 
     def open(self, row: str, col: str) -> bool:
-        """Open (possibly recursively) a cell
+        """Open a cell, cascading into neighboring cells when it is safe
 
         Args:
             row (str): row coordinate
             col (str): column coordinate
 
+        Note:
+            Flagged cells are left alone. The flag has to be removed before the cell can be opened.
+
         Returns:
             bool: Whether the game is still going
         """
-        if self._board[(row, col)].is_flagged():
-            print("Use f " + str(row) + " " + str(col) + " to remove the flag on this cell before opening.")
-            time.sleep(2.0)
+        _cell = self._idx(row, col)
+        if self._board[_cell].is_flagged():
             return True
 
-        if self._board[(row, col)].is_open():
-            if int(self._board[(row, col)].name()) == len(self._get_neighbors((row, col),flagged=True)):
-                for _unopened in self._get_neighbors((row, col),unmarked=True):
-                    self.open(_unopened[0],_unopened[1])
+        if self._board[_cell].is_open():
+            # Chord: once all the neighboring mines are flagged, open the rest of the neighbors
+            _flagged = 0
+            _unmarked = []
+            for _neighbor in self._neighbors_of(_cell):
+                if self._board[_neighbor].is_flagged():
+                    _flagged += 1
+                elif not self._board[_neighbor].is_open():
+                    _unmarked.append(_neighbor)
+
+            if int(self._board[_cell].name()) == _flagged:
+                return self._flood(_unmarked)
             return True
 
-        if not self._board[(row, col)].open():
-            if self._board[(row, col)].is_safe():
-                #for _cell in list(filter(lambda cell: not self._board[cell].is_open(), self._get_neighbors((row, col)))):
-                for _cell in self._get_neighbors((row, col),unmarked=True):
-                    self.open(_cell[0],_cell[1])
-            return True
+        return self._flood([_cell])
 
-        return False
+
+    def _flood(self, seeds) -> bool:
+        """(private) Open the given unmarked cells and flood-fill outwards from any safe ones
+
+        Note:
+            Uses a work queue rather than recursion so large cascades don't hit the recursion limit.
+            Every queued cell is opened exactly once, so the counters are updated from _visited at the end.
+
+        Args:
+            seeds (list): indexes of the cells to open
+
+        Returns:
+            bool: Whether the game is still going
+        """
+        _board = self._board
+        _neighbors = self._neighbors
+        _queue = deque(seeds)
+        _visited = set(seeds)
+        _alive = True
+        while _queue:
+            _cell_idx = _queue.popleft()
+            _cell = _board[_cell_idx]
+            if _cell.open():
+                _alive = False
+            elif _cell.is_safe():
+                for _neighbor in _neighbors[_cell_idx]:
+                    if (_neighbor not in _visited and
+                        not _board[_neighbor].is_flagged() and not _board[_neighbor].is_open()):
+                        _visited.add(_neighbor)
+                        _queue.append(_neighbor)
+
+        self._open_count += len(_visited)
+        self._dirty.update(_cell // self.c_size for _cell in _visited)
+
+        return _alive
 
 
     def _num_flagged(self) -> int:
         """Gets the number of cells that have been flagged as potentially mined
 
+        Note:
+            Kept up to date by flag() and reveal() so this does not need to scan the board.
+
         Returns:
             int: number of mines
         """
-        return len(list(filter(lambda cell: self._board[cell].is_flagged(), self._board_cells)))
+        return self._flagged_count
 
 
     def complete(self) -> bool:
@@ -273,8 +462,7 @@ class GameBoard:
         Returns:
             bool: All cells are open or flagged
         """
-        return len(self._board_cells) == (self._num_flagged() +
-                   len(list(filter(lambda cell: self._board[cell].is_open(), self._board_cells))))
+        return len(self._board_cells) == self._num_flagged() + self._open_count
 
 
     def is_cell(self, row: str, col: str) -> bool:
@@ -286,7 +474,21 @@ class GameBoard:
         Returns:
             bool: Cell is on the board
         """
-        return (row, col) in self._board_cells
+        return (COORD_IDX.get(row, self.r_size) < self.r_size and
+                COORD_IDX.get(col, self.c_size) < self.c_size)
+
+
+    def is_flagged(self, row: str, col: str) -> bool:
+        """Checks if the specified cell has been flagged as a potential mine
+
+        Args:
+            row (str) : row coordinate
+            col (str) : column coordinate
+
+        Returns:
+            bool: Cell is flagged
+        """
+        return self._board[self._idx(row, col)].is_flagged()
 
 
     def flag(self, row: str, col: str):
@@ -296,14 +498,25 @@ class GameBoard:
             row (str): row coordinate
             col (str): column coordinate
         """
-        self._board[(row, col)].toggle()
+        _idx = self._idx(row, col)
+        self._dirty.add(_idx // self.c_size)
+        _cell = self._board[_idx]
+        _cell.toggle()
+        if _cell.is_flagged():
+            self._flagged_count += 1
+        else:
+            self._flagged_count -= 1
 
 
     def reveal(self):
         """Reveal the full map.
 
         Note:
-            There is no need to iterate using items() because we are only interested in the key, not the value.
+            Cells that are already showing their label are skipped.
         """
-        for _cell in self._board.items():
-            _cell[1].open()
+        for _idx, _cell in enumerate(self._board):
+            if not _cell.is_open() or _cell.is_flagged():
+                _cell.open()
+                self._dirty.add(_idx // self.c_size)
+        self._flagged_count = 0
+        self._open_count = len(self._board_cells)
@@ -16,9 +16,7 @@ from colorama import Back, Style
 class GameCell:
     """Gameboard cell. May or may not be a mine.
     """
-    _is_flagged = False
-    _is_open = False
-    _int_name = 0
+    __slots__ = ('_is_mine', '_label', '_int_name', '_is_flagged', '_is_open', '_rendered')
 
     def __init__(self, name, mine=False):
         """Constructor
@@ -27,6 +25,10 @@ class GameCell:
             name: value to set the label to (number of neighbor mines or M if we are a mine)
             mine (bool, optional): Are we a mine? Defaults to False.
         """
+        self._is_flagged = False
+        self._is_open = False
+        self._int_name = 0
+        self._rendered = None
         self.is_mine = mine
         try:
             self.label = name
@@ -37,16 +39,21 @@ class GameCell:
     def __repr__(self):
         """Representation matters
 
+        Note:
+            The string is cached until the cell is opened, flagged or relabeled.
+
         Returns:
             str: String representation of the cell
         """
-        if self._is_flagged:
-            return Style.DIM + Back.CYAN + emoji.emojize(":play_button:") + " " + Style.RESET_ALL
-
-        if self._is_open:
-            return Style.DIM + Back.CYAN + self.label + Style.RESET_ALL
+        if self._rendered is None:
+            if self._is_flagged:
+                self._rendered = Style.DIM + Back.CYAN + emoji.emojize(":play_button:") + " " + Style.RESET_ALL
+            elif self._is_open:
+                self._rendered = Style.DIM + Back.CYAN + self.label + Style.RESET_ALL
+            else:
+                self._rendered = Style.DIM + Back.CYAN + emoji.emojize(":blue_square:") + Style.RESET_ALL
 
-        return Style.DIM + Back.CYAN + emoji.emojize(":blue_square:") + Style.RESET_ALL
+        return self._rendered
 
 
     @property
@@ -81,6 +88,8 @@ class GameCell:
 
             self._label = name
 
+        self._rendered = None
+
 
     def name(self) -> str:
         """Returns the non-emoji name of the cell
@@ -147,6 +156,7 @@ class GameCell:
             self._is_flagged = True
         else:
             self._is_flagged = False
+        self._rendered = None
 
 
     def open(self) -> bool:
@@ -157,4 +167,5 @@ class GameCell:
         """
         self._is_open = True
         self._is_flagged = False
+        self._rendered = None
         return self.is_mine
@@ -0,0 +1,5 @@
+"""pytest configuration: make the package under src/ importable without installing it"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,185 @@
+"""Checks that redrawing the board in place leaves the same screen as drawing it from scratch
+
+Games are played through pysweeper.__main__.main() with its output fed into a pyte terminal emulator.
+Right after every render, and again at every prompt, the board on that screen is compared with a fresh
+GameBoard.render_full().
+"""
+import builtins
+import os
+import random
+import sys
+
+import pytest
+
+pyte = pytest.importorskip("pyte")
+
+from pysweeper import __main__ as game_main  # pylint: disable=wrong-import-position
+from pysweeper import board  # pylint: disable=wrong-import-position
+
+
+class Terminal:
+    """File-like object that writes into a pyte screen the way a tty would"""
+    def __init__(self, width, height):
+        self.screen = pyte.Screen(width, height)
+        self.stream = pyte.Stream(self.screen)
+        self.rendered = None
+
+    def write(self, text):
+        self.stream.feed(text.replace("\n", "\r\n"))
+        if self.rendered is not None:
+            # print(game) writes the board first, so this is the screen just after the render
+            game, self.rendered = self.rendered, None
+            assert_matches_full_render(self.screen, game)
+
+    def flush(self):
+        pass
+
+
+def board_lines(screen, game):
+    """The lines of the screen that hold the board, from the title down to the bottom border"""
+    return [tuple((screen.buffer[y][x].data or " ", screen.buffer[y][x].bg, screen.buffer[y][x].bold)
+                  for x in range(screen.columns))
+            for y in range(board.BOARD_TOP + game.r_size)]
+
+
+def assert_matches_full_render(screen, game):
+    expected = pyte.Screen(screen.columns, screen.lines)
+    pyte.Stream(expected).feed(game.render_full().replace("\n", "\r\n"))
+    assert board_lines(screen, game) == board_lines(expected, game)
+
+
+def random_moves(rng, game):
+    """Mostly valid moves, with some bad and overly long ones to produce notices"""
+    while True:
+        roll = rng.random()
+        row = rng.choice(board.COORD_LIST[:game.r_size])
+        col = rng.choice(board.COORD_LIST[:game.c_size])
+        if roll < 0.05:
+            yield "nonsense"
+        elif roll < 0.10:
+            yield "o " + row + " " + "Q" * rng.randint(1, 60)
+        elif roll < 0.30:
+            yield "f " + row + " " + col
+        else:
+            yield "o " + row + " " + col
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    def make(width, height):
+        _term = Terminal(width, height)
+        monkeypatch.setattr(board.os, "get_terminal_size", lambda *args: os.terminal_size((width, height)))
+        monkeypatch.setattr(sys, "stdout", _term)
+        monkeypatch.setattr(sys, "stderr", _term)
+        return _term
+    return make
+
+
+def play(monkeypatch, term, rows, cols, mines, make_moves, max_moves=150):
+    """Play a game through main(), checking the screen after every render and at every prompt
+
+    Args:
+        make_moves: called with the GameBoard, returns an iterator of moves to type
+    """
+    games = []
+
+    class RecordedBoard(board.GameBoard):
+        __slots__ = ()
+        def __init__(self, *args):
+            super().__init__(*args)
+            games.append(self)
+
+        def __repr__(self):
+            _display = super().__repr__()
+            term.rendered = self
+            return _display
+
+    moves = []
+    def fake_input(prompt):
+        term.write(prompt)
+        assert_matches_full_render(term.screen, games[0])
+        if not moves:
+            moves.append(make_moves(games[0]))
+        move = next(moves[0], None)
+        if move is None or len(moves) > max_moves:
+            raise EOFError
+        moves.append(move)
+        term.write(move + "\n")
+        return move
+
+    monkeypatch.setattr(board, "GameBoard", RecordedBoard)
+    monkeypatch.setattr(builtins, "input", fake_input)
+    with pytest.raises((SystemExit, EOFError)):
+        game_main.main(["-r", str(rows), "-c", str(cols), "-m", str(mines)])
+
+
+@pytest.mark.parametrize("width,height,rows,cols,mines", [
+    (120, 60, 12, 15, 20),
+    (100, 50, 30, 30, 80),
+    (80, 50, 36, 36, 100),   # header line is wider than the terminal
+    (80, 16, 7, 8, 6),       # no room for the line the cursor moves to after the prompt
+    (80, 17, 7, 8, 6),       # exactly enough room
+    (50, 40, 10, 10, 10),    # notices and some moves are wider than the terminal
+    (50, 17, 7, 8, 6),       # ... and would scroll it if they wrapped
+])
+@pytest.mark.parametrize("seed", range(3))
+def test_screen_matches_full_render(monkeypatch, terminal, width, height, rows, cols, mines, seed):
+    term = terminal(width, height)
+    random.seed(seed)
+    rng = random.Random(seed)
+    play(monkeypatch, term, rows, cols, mines, lambda game: random_moves(rng, game))
+
+
+def test_long_move_at_the_bottom_of_the_screen(monkeypatch, terminal):
+    # The second long move is typed under the notice about the first one, on the last line of an
+    # exactly fitting screen, so it wraps and scrolls the board
+    term = terminal(50, 17)
+    random.seed(0)
+    long_move = "o 0 " + "Q" * 60
+    play(monkeypatch, term, 7, 8, 6, lambda game: iter(["f 0 0", long_move, long_move, "f 1 1", "f 2 2"]))
+
+
+@pytest.mark.parametrize("width,height,rows,cols,in_place", [
+    (120, 60, 12, 15, True),
+    (80, 17, 7, 8, True),
+    (80, 16, 7, 8, False),
+    (80, 50, 36, 36, False),
+    (100, 50, 30, 30, True),
+])
+def test_redraw_in_place_only_when_it_fits(terminal, width, height, rows, cols, in_place):
+    terminal(width, height)
+    game = board.GameBoard(rows, cols, 5)
+    assert repr(game).startswith(board.CLEAR_SCREEN)
+    game.flag("0", "0")
+    assert (not repr(game).startswith(board.CLEAR_SCREEN)) == in_place
+    game.redraw()
+    assert repr(game).startswith(board.CLEAR_SCREEN)
+
+
+def test_revealed_numbers_and_flags(monkeypatch, terminal):
+    # Keycaps and flags are padded for terminals that draw them 1 column wide, so a row with them in it
+    # is wider than 2 columns per cell. Updating it in place must still give the full render's layout.
+    term = terminal(80, 40)
+    random.seed(1)
+    moves = ["f " + row + " " + col for row in "0123" for col in "01234567"]
+    moves += ["o " + row + " " + col for row in "4567" for col in "01234567"]
+    play(monkeypatch, term, 8, 8, 10, lambda game: iter(moves))
+
+
+def test_resize_forces_full_redraw(monkeypatch, terminal):
+    terminal(120, 60)
+    game = board.GameBoard(12, 15, 5)
+    repr(game)
+    game.flag("0", "0")
+    assert not repr(game).startswith(board.CLEAR_SCREEN)
+    monkeypatch.setattr(board.os, "get_terminal_size", lambda *args: os.terminal_size((100, 60)))
+    game.flag("0", "1")
+    assert repr(game).startswith(board.CLEAR_SCREEN)
+    assert game.term_width == 100
+    game.flag("0", "2")
+    assert not repr(game).startswith(board.CLEAR_SCREEN)
+    # Shrunk until the board no longer fits: keep redrawing in full
+    monkeypatch.setattr(board.os, "get_terminal_size", lambda *args: os.terminal_size((100, 15)))
+    for col in "345":
+        game.flag("0", col)
+        assert repr(game).startswith(board.CLEAR_SCREEN)